@@ -23,7 +23,7 @@ import numpy as np
 import pandas as pd
 
 
-def ahp_weights(weights_dict: dict) -> dict:
+def ahp_weights(weights_dict: dict, validate: bool = True) -> dict:
     """
     Calculate normalized AHP weights for each category/sub-category
     using Saaty's geometric mean method.
@@ -32,6 +32,9 @@ def ahp_weights(weights_dict: dict) -> dict:
     ----------
     weights_dict : dict
         Dictionary of pairwise comparison matrices (from Excel or cat_config).
+    validate : bool, optional
+        Warn about matrices that are not reciprocal (default True). Pass False
+        in hot paths with trusted matrices to skip the check.
 
     Returns
     -------
@@ -44,34 +47,42 @@ def ahp_weights(weights_dict: dict) -> dict:
     -----
     - Uses geometric mean method:
         w_i = (Π_j a_ij)^(1/n), then normalize sum(w_i) = 1
-    - Checks for reciprocal consistency and square matrix.
+      computed as exp(mean_j log a_ij) to avoid overflow for large matrices.
+    - Checks for square matrix and, unless `validate=False`, reciprocal consistency.
     """
     final_weights = {}
 
     for sheet_name, matrix in weights_dict.items():
-        # Convert to DataFrame if dict
-        df = pd.DataFrame(matrix)
-
-        # Check if square
-        if df.shape[0] != df.shape[1]:
-            raise ValueError(f"AHP matrix '{sheet_name}' is not square: {df.shape}")
-
-        # Ensure indices match columns
-        if not all(df.index == df.columns):
-            df.index = df.columns
-
-        arr = df.values.astype(float)
-
-        # Optional: check reciprocity
-        if not np.allclose(arr, 1 / arr.T, atol=1e-2):
+        # Fast path for {column: {row: value}} (DataFrame.to_dict()) with matching row/column labels
+        items = list(matrix.keys()) if isinstance(matrix, dict) else None
+        if items is not None and all(
+            isinstance(col, dict) and col.keys() == set(items) for col in matrix.values()
+        ):
+            arr = np.array([[matrix[c][r] for c in items] for r in items], dtype=np.float64)
+        else:
+            df = pd.DataFrame(matrix)
+
+            # Check if square
+            if df.shape[0] != df.shape[1]:
+                raise ValueError(f"AHP matrix '{sheet_name}' is not square: {df.shape}")
+
+            # Ensure indices match columns (e.g. a row label edited in the workbook)
+            if not all(df.index == df.columns):
+                df.index = df.columns
+
+            items = list(df.index)
+            arr = df.values.astype(np.float64)
+
+        # Optional: check reciprocity (a_ij * a_ji == 1)
+        if validate and not np.allclose(arr * arr.T, 1.0, atol=1e-2):
             print(f"!!! Warning: Matrix '{sheet_name}' may not be fully reciprocal.")
 
-        # Geometric mean method
-        geom_means = np.prod(arr, axis=1) ** (1 / arr.shape[0])
+        # Geometric mean method (log domain to avoid overflow of the row product)
+        geom_means = np.exp(np.log(arr).mean(axis=1))
         norm_weights = geom_means / np.sum(geom_means)
 
         # Store as dict
-        final_weights[sheet_name] = dict(zip(df.index, norm_weights))
+        final_weights[sheet_name] = dict(zip(items, norm_weights))
 
     return final_weights
 
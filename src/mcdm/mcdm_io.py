@@ -21,11 +21,17 @@ from mcdm_tool.mcdm_io import cat_config
 categories, weights, data = cat_config()
 """
 
+import hashlib
 import os
 import pandas as pd
 import numpy as np
 
-def cat_config(csv_path=None):
+try:
+    import pyarrow  # noqa: F401  (parquet engine for the weights cache)
+except ImportError:  # pyarrow is optional: weights are then always read from Excel
+    pyarrow = None
+
+def cat_config(csv_path=None, use_cache=True):
     """
     Configure categories and subcategories for MCDM analysis.
 
@@ -38,6 +44,11 @@ def cat_config(csv_path=None):
     csv_path : str, optional
         Full path to the CSV file for configuration. If None, a default file
         is created at "~/Documents/mcdm_config.csv".
+    use_cache : bool, optional
+        Reuse the pairwise matrices of the previous run when the categories are
+        unchanged (default True). Set to False to always regenerate the Excel
+        file and wait for the weights to be adjusted; no cache files are
+        written then.
 
     Returns
     -------
@@ -57,6 +68,12 @@ def cat_config(csv_path=None):
       adapts automatically.
     - Placeholder values in the default CSV are examples; users should enter
       actual regional data.
+    - If the categories and sub-categories are unchanged since the last run
+      (tracked in "~/Documents/mcdm_weights.meta"), the existing
+      "mcdm_weights.xlsx" is reused without being regenerated. If pyarrow is
+      installed, the weights read back from it are also stored as parquet files
+      in "~/Documents/mcdm_weights_cache" and read from there while they are
+      newer than the Excel file.
     """
 
     # --- 1. Creating default CSV template ---
@@ -116,42 +133,86 @@ def cat_config(csv_path=None):
         df_final = pd.read_csv(csv_path, encoding="cp1254")
 
     # 3. Create hierarchical categories structure
-    categories = {}
-    for _, row in df_final.iterrows():
-        reg = row["Region"]
-        cat = row["Category"]
-        sub = row["Sub-category"]
-        categories.setdefault(reg, {}).setdefault(cat, []).append(sub)
+    categories = _category_tree(df_final)
 
     # 4. Generate pairwise comparison matrices
     def create_pairwise_matrix(items):
         n = len(items)
-        return pd.DataFrame(np.eye(n), index=items, columns=items)
+        # int8 is enough for the identity template and keeps the writer light
+        return pd.DataFrame(np.eye(n, dtype=np.int8), index=items, columns=items)
 
     excel_path = os.path.expanduser("~/Documents/mcdm_weights.xlsx")
-    with pd.ExcelWriter(excel_path) as writer:
-        # General categories (only once)
-        all_cats = sorted(set(df_final["Category"]))
-        create_pairwise_matrix(all_cats).to_excel(writer, sheet_name="General")
-
-        # Sub-categories
-        for cat in all_cats:
-            subcats = df_final[df_final["Category"] == cat]["Sub-category"].unique().tolist()
-            if len(subcats) > 1:
-                create_pairwise_matrix(subcats).to_excel(writer, sheet_name=cat[:25])
-
-    print(f"\nPairwise matrices exported to Excel: {excel_path}")
-    input("Press ENTER after adjusting the weights...")
+    meta_path = os.path.splitext(excel_path)[0] + ".meta"
+    cache_dir = os.path.splitext(excel_path)[0] + "_cache"
+
+    all_cats = sorted(set(df_final["Category"]))
+    sub_by_cat = df_final.groupby("Category", sort=False)["Sub-category"].unique()
+    sheets = ["General"] + [cat[:25] for cat in all_cats if len(sub_by_cat[cat]) > 1]
+
+    # Fingerprint of the category structure the matrices were generated for
+    pairs = set(df_final[["Category", "Sub-category"]].itertuples(index=False, name=None))
+    # (sorted by repr: blank cells are NaN floats and do not compare with str)
+    structure_key = hashlib.sha256(repr(sorted(map(repr, pairs))).encode()).hexdigest()
+    unchanged = False
+    if use_cache and os.path.exists(excel_path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            unchanged = f.read().strip() == structure_key
+
+    if unchanged:
+        print(f"\nCategories unchanged, reusing pairwise matrices: {excel_path}")
+    else:
+        with pd.ExcelWriter(excel_path) as writer:
+            # General categories (only once)
+            create_pairwise_matrix(all_cats).to_excel(writer, sheet_name="General")
+
+            # Sub-categories
+            for cat in all_cats:
+                subcats = sub_by_cat[cat].tolist()
+                if len(subcats) > 1:
+                    create_pairwise_matrix(subcats).to_excel(writer, sheet_name=cat[:25])
+
+        print(f"\nPairwise matrices exported to Excel: {excel_path}")
+        input("Press ENTER after adjusting the weights...")
+
+    # 5. Reading user-modified weights (parquet cache if it is newer than the Excel file)
+    parquet_paths = {sheet: os.path.join(cache_dir, f"{sheet}.parquet") for sheet in sheets}
+    use_parquet = use_cache and pyarrow is not None
+    cache_valid = use_parquet and unchanged and all(
+        os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(excel_path)
+        for path in parquet_paths.values()
+    )
 
-    # 5. Reading user-modified weights
     weights = {}
-    xls = pd.ExcelFile(excel_path)
-    for sheet in xls.sheet_names:
-        df_sheet = pd.read_excel(xls, sheet_name=sheet, index_col=0)
-        weights[sheet] = df_sheet.to_dict()
+    if cache_valid:
+        for sheet, path in parquet_paths.items():
+            weights[sheet] = pd.read_parquet(path).to_dict()
+    else:
+        if use_parquet:
+            os.makedirs(cache_dir, exist_ok=True)
+        xls = pd.ExcelFile(excel_path)
+        for sheet in xls.sheet_names:
+            df_sheet = pd.read_excel(xls, sheet_name=sheet, index_col=0)
+            if use_parquet:
+                df_sheet.to_parquet(os.path.join(cache_dir, f"{sheet}.parquet"))
+            weights[sheet] = df_sheet.to_dict()
+
+    if use_cache and not unchanged:
+        with open(meta_path, "w", encoding="utf-8") as f:
+            f.write(structure_key)
 
     # 6. Prepare simplified data for MCDM
     data = df_final.drop(columns=["Unit"])  # Unit not used in calculations
 
     print("\nFinal data is ready.\n")
     return categories, weights, data
+
+
+def _category_tree(df: pd.DataFrame) -> dict:
+    """Region -> Category -> list of Sub-categories, in row order (blank keys kept as NaN)."""
+    return {
+        reg: {
+            cat: cat_df["Sub-category"].tolist()
+            for cat, cat_df in reg_df.groupby("Category", sort=False, dropna=False)
+        }
+        for reg, reg_df in df.groupby("Region", sort=False, dropna=False)
+    }
@@ -1,6 +1,9 @@
 # normalisation.py
 import pandas as pd
 import numpy as np
+from pandas.api.types import is_numeric_dtype
+
+_VALUE_CLEANUP = str.maketrans({"\u00a0": "", " ": "", ",": "."})
 
 def min_max_normalize(data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -17,29 +20,29 @@ def min_max_normalize(data: pd.DataFrame) -> pd.DataFrame:
         Normalized values in "Value" column, range [0,1]
     """
     norm_data = data.copy()
-    norm_data["Value"] = (
-        norm_data["Value"]
-        .astype(str)
-        .str.replace("\u00a0", "", regex=False)
-        .str.replace(" ", "", regex=False)
-        .str.replace(",", ".", regex=False)
-        .pipe(pd.to_numeric, errors="raise")
-    )
-
-    for cat in norm_data["Category"].unique():
-        for sub in norm_data[norm_data["Category"] == cat]["Sub-category"].unique():
-            mask = (norm_data["Category"] == cat) & (norm_data["Sub-category"] == sub)
-            values = norm_data.loc[mask, "Value"]
-            ctype = norm_data.loc[mask, "Cost/Benefit"].iloc[0]
-
-            if values.max() == values.min():
-                # bütün dəyərlər eyni → 1.0
-                norm_data.loc[mask, "Value"] = 1.0
-            elif ctype.lower() == "cost":
-                # Cost: az daha yaxşı → ters çevirmək
-                norm_data.loc[mask, "Value"] = (values.max() - values) / (values.max() - values.min())
-            else:
-                # Benefit: artmaq daha yaxşı
-                norm_data.loc[mask, "Value"] = (values - values.min()) / (values.max() - values.min())
+    if not is_numeric_dtype(norm_data["Value"]):
+        # Drop (non-breaking) spaces and use "." as decimal separator in a single pass
+        norm_data["Value"] = pd.to_numeric(
+            norm_data["Value"].astype(str).str.translate(_VALUE_CLEANUP),
+            errors="raise",
+        )
+
+    # Per-criterion min/max broadcast back to every row in a single groupby pass
+    values = norm_data["Value"].to_numpy(dtype=np.float64)
+    grouped = norm_data.groupby(["Category", "Sub-category"], sort=False)["Value"]
+    vmin = grouped.transform("min").to_numpy(dtype=np.float64)
+    vmax = grouped.transform("max").to_numpy(dtype=np.float64)
+    value_range = vmax - vmin
+    # Cost/Benefit flag per row, evaluated once for the whole column
+    is_cost_row = norm_data["Cost/Benefit"].str.lower().eq("cost").to_numpy()
+
+    # Cost: az daha yaxşı → ters çevirmək; Benefit: artmaq daha yaxşı
+    numerator = np.where(is_cost_row, vmax - values, values - vmin)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = numerator / value_range
+    # bütün dəyərlər eyni → 1.0
+    result[value_range == 0] = 1.0
+
+    norm_data["Value"] = result
 
     return norm_data
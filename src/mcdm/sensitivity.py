@@ -19,11 +19,32 @@ from mcdm_tool.sensitivity import sensitivity_analysis
 base_scores, results = sensitivity_analysis(norm_data, weights, delta=0.1)
 """
 
-import copy
+import hashlib
+import os
+import numpy as np
 import pandas as pd
-from mcdm.topsis import topsis
+from joblib import Memory, Parallel, delayed
+from mcdm import topsis as _topsis_module
+from mcdm.topsis import _prepare, _score, _score_kernel, _weight_vector
 
-def sensitivity_analysis(norm_data: pd.DataFrame, weights: dict, delta: float = 0.1):
+# Default location of the persistent sweep cache (see `use_cache`)
+DEFAULT_CACHE_DIR = "~/.cache/mcdm"
+
+
+def _code_fingerprint() -> str:
+    """Hash of the topsis and sensitivity sources, so cached results expire when the maths changes."""
+    digest = hashlib.sha256()
+    for path in (_topsis_module.__file__, __file__):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+_CODE_KEY = _code_fingerprint()
+
+
+def sensitivity_analysis(norm_data: pd.DataFrame, weights: dict, delta: float = 0.1, n_jobs: int = -1,
+                         use_cache: bool = False, cache_dir: str = None):
     """
     Perform sensitivity analysis by varying AHP weights ±delta.
 
@@ -36,6 +57,16 @@ def sensitivity_analysis(norm_data: pd.DataFrame, weights: dict, delta: float =
         { "Category1": {"Sub1": 0.4, "Sub2": 0.6}, ... }
     delta : float, optional
         Relative change to apply to each weight (default 0.1 = ±10%).
+    n_jobs : int, optional
+        Number of threads used to score the perturbations (default -1 = all cores).
+        Ignored when numba is installed, as the compiled kernel is parallel itself.
+    use_cache : bool, optional
+        Store results on disk and reuse them for the same data, weights, delta
+        and library code (default False = always recompute).
+    cache_dir : str, optional
+        Cache location when `use_cache` is True (default "~/.cache/mcdm").
+        Delete the directory, or call `joblib.Memory(cache_dir).clear()`, to
+        free the space.
 
     Returns
     -------
@@ -45,32 +76,65 @@ def sensitivity_analysis(norm_data: pd.DataFrame, weights: dict, delta: float =
         Dictionary of TOPSIS scores for each weight perturbation.
         Format: {"Category_Sub_plus": DataFrame, "Category_Sub_minus": DataFrame, ...}
     """
+    if not use_cache:
+        return _sensitivity_sweep(norm_data, weights, delta, n_jobs)
+
+    # Hash the inputs by hand: the cached call ignores the raw frame and dict
+    data_key = (tuple(norm_data.columns), pd.util.hash_pandas_object(norm_data, index=True).values.tobytes())
+    weights_key = tuple((cat, sub, float(w)) for cat, sub_dict in weights.items() for sub, w in sub_dict.items())
+    location = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+    cached_sweep = Memory(location, verbose=0).cache(_keyed_sweep, ignore=["norm_data", "weights", "n_jobs"])
+    return cached_sweep(norm_data, weights, delta, n_jobs, data_key, weights_key, _CODE_KEY)
+
+
+def _sensitivity_sweep(norm_data: pd.DataFrame, weights: dict, delta: float, n_jobs: int):
+    """Uncached body of `sensitivity_analysis`."""
+    # The value matrix does not depend on the weights: build it once
+    regions, criteria, values, _ = _prepare(norm_data)
+
+    # Flat weights, grouped by category: category g owns w_base[bounds[g]:bounds[g + 1]]
+    keys = [(cat, sub) for cat, sub_dict in weights.items() for sub in sub_dict]
+    w_base = np.fromiter((weights[cat][sub] for cat, sub in keys), dtype=np.float64, count=len(keys))
+    bounds = np.concatenate(([0], np.cumsum([len(sub_dict) for sub_dict in weights.values()], dtype=np.intp)))
+    cat_id = np.repeat(np.arange(len(weights)), np.diff(bounds))
+
+    # Matrix column fed by each weight (-1 if the sub-category has no data)
+    cols = criteria.get_indexer(keys)
+    present = cols >= 0
+    target = cols[present]
+    base_vec = _weight_vector(criteria, weights)
+
+    def to_frame(scores):
+        return pd.DataFrame({"Region": regions, "TOPSIS Score": scores})
+
     # Compute base TOPSIS scores
-    base_scores = topsis(norm_data, weights)
-
-    results = {}
-
-    # Iterate over categories and sub-categories
-    for category, sub_dict in weights.items():
-        for sub_category, orig_weight in sub_dict.items():
-            # Increase weight by delta
-            weights_plus = copy.deepcopy(weights)
-            weights_plus[category][sub_category] = orig_weight * (1 + delta)
-            # Normalize weights within the category to sum=1
-            total = sum(weights_plus[category].values())
-            for key in weights_plus[category]:
-                weights_plus[category][key] /= total
-            scores_plus = topsis(norm_data, weights_plus)
-            results[f"{category}_{sub_category}_plus"] = scores_plus
-
-            # Decrease weight by delta
-            weights_minus = copy.deepcopy(weights)
-            weights_minus[category][sub_category] = orig_weight * (1 - delta)
-            # Normalize weights within the category to sum=1
-            total = sum(weights_minus[category].values())
-            for key in weights_minus[category]:
-                weights_minus[category][key] /= total
-            scores_minus = topsis(norm_data, weights_minus)
-            results[f"{category}_{sub_category}_minus"] = scores_minus
+    base_scores = to_frame(_score(values, base_vec))
+
+    # Collect every perturbed weight vector first; scoring them is independent
+    tasks = []
+    for j, (category, sub_category) in enumerate(keys):
+        lo, hi = bounds[cat_id[j]], bounds[cat_id[j] + 1]
+        for suffix, factor in (("plus", 1 + delta), ("minus", 1 - delta)):
+            # Change one weight and normalize weights within the category to sum=1
+            w = w_base.copy()
+            w[j] *= factor
+            w[lo:hi] /= w[lo:hi].sum()
+
+            w_vec = base_vec.copy()
+            w_vec[target] = w[present]
+            tasks.append((f"{category}_{sub_category}_{suffix}", w_vec))
+
+    if _score_kernel is not None:
+        # The numba kernel is already parallel over regions/criteria; do not nest thread pools
+        out = [_score(values, w_vec) for _, w_vec in tasks]
+    else:
+        # _score is pure NumPy, so threads avoid process start-up and data copies
+        out = Parallel(n_jobs=n_jobs, prefer="threads")(delayed(_score)(values, w_vec) for _, w_vec in tasks)
+    results = {label: to_frame(scores) for (label, _), scores in zip(tasks, out)}
 
     return base_scores, results
+
+
+def _keyed_sweep(norm_data, weights, delta, n_jobs, data_key, weights_key, code_key):
+    """`_sensitivity_sweep` memoized on (delta, data_key, weights_key, code_key) only."""
+    return _sensitivity_sweep(norm_data, weights, delta, n_jobs)
@@ -17,6 +17,11 @@ Features:
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional: fall back to plain NumPy
+    njit = None
+
 def topsis(norm_data: pd.DataFrame, weights: dict, criteria_type_col: str = None) -> pd.DataFrame:
     """
     Compute TOPSIS scores for regional MCDM evaluation.
@@ -40,45 +45,146 @@ def topsis(norm_data: pd.DataFrame, weights: dict, criteria_type_col: str = None
     pd.DataFrame
         Columns: ["Region", "TOPSIS Score"]
     """
+    regions, criteria, values, offset = _prepare(norm_data, criteria_type_col)
+    scores = _score(values, _weight_vector(criteria, weights), offset)
+    return pd.DataFrame({'Region': regions, 'TOPSIS Score': scores})
+
 
-    df = norm_data.copy()
+def _prepare(norm_data: pd.DataFrame, criteria_type_col: str = None):
+    """
+    Assemble the weight-independent part of TOPSIS.
 
-    # Compute weighted value: Category weight * Sub-category weight
-    def get_weight(row):
-        cat, sub = row['Category'], row['Sub-category']
-        return weights.get(cat, {}).get(sub, 1.0)  # default 1.0 if missing
+    Returns
+    -------
+    regions : pd.Index
+        Sorted region labels (matrix rows).
+    criteria : pd.MultiIndex
+        (Category, Sub-category) keys (matrix columns).
+    values : np.ndarray
+        Dense (n_regions, n_criteria) float32 matrix of summed values; Cost rows
+        enter with a negative sign when `criteria_type_col` is given.
+    offset : np.ndarray or None
+        Number of Cost rows per cell, so that `values * w + offset` equals
+        the sum of `1 - value * w` (Cost) and `value * w` (Benefit) rows.
+    """
+    # Like pivot_table: skip rows with a missing key or value
+    valid = ~(norm_data[['Region', 'Category', 'Sub-category', 'Value']].isna().any(axis=1).to_numpy())
 
-    df['Weight'] = df.apply(get_weight, axis=1)
-    df['Weighted'] = df['Value'] * df['Weight']
+    # Pull the needed columns out once; everything below works on flat ndarrays
+    region = norm_data['Region'].to_numpy()[valid]
+    # float32 is plenty for normalized values/AHP weights and halves memory traffic
+    val = norm_data['Value'].to_numpy(dtype=np.float32)[valid]
+
+    cat = norm_data['Category'].to_numpy()[valid]
+    sub = norm_data['Sub-category'].to_numpy()[valid]
+
+    row_codes, regions = pd.factorize(region, sort=True)
+    col_codes, criteria = pd.MultiIndex.from_arrays([cat, sub]).factorize()
+    shape = (regions.size, criteria.size)
+    offset = None
 
     # Adjust for Cost criteria: convert to Benefit
     if criteria_type_col:
-        cost_mask = df[criteria_type_col].str.lower() == 'cost'
-        df.loc[cost_mask, 'Weighted'] = 1 - df.loc[cost_mask, 'Weighted']
-
-    # Pivot to matrix: rows=Region, columns=(Category, Sub-category)
-    df_pivot = df.pivot_table(
-        index='Region',
-        columns=['Category', 'Sub-category'],
-        values='Weighted',
-        aggfunc='sum',
-        fill_value=0
-    )
+        cost_mask = (norm_data[criteria_type_col].str.lower() == 'cost').to_numpy()[valid]
+        val[cost_mask] *= -1
+        offset = np.zeros(shape, dtype=np.float32)
+        np.add.at(offset, (row_codes[cost_mask], col_codes[cost_mask]), 1.0)
 
-    # Compute ideal (max) and anti-ideal (min) solution per criterion
-    ideal = df_pivot.max()
-    anti_ideal = df_pivot.min()
+    # Dense matrix: rows=Region, columns=(Category, Sub-category)
+    values = np.zeros(shape, dtype=np.float32)
+    np.add.at(values, (row_codes, col_codes), val)
 
-    # Euclidean distance to ideal and anti-ideal
-    dist_to_ideal = np.sqrt(((df_pivot - ideal)**2).sum(axis=1))
-    dist_to_anti = np.sqrt(((df_pivot - anti_ideal)**2).sum(axis=1))
+    return regions, criteria, values, offset
 
-    # TOPSIS closeness coefficient
-    scores = dist_to_anti / (dist_to_ideal + dist_to_anti)
+
+def _weight_vector(criteria: pd.MultiIndex, weights: dict) -> np.ndarray:
+    """Look up the weight of each (Category, Sub-category) column, default 1.0 if missing."""
+    flat_weights = {(cat, sub): w for cat, sub_dict in weights.items() for sub, w in sub_dict.items()}
+    return criteria.map(flat_weights).to_numpy(dtype=np.float32, na_value=1.0)
+
+
+def _score(values: np.ndarray, w_vec: np.ndarray, offset: np.ndarray = None) -> np.ndarray:
+    """TOPSIS scores in [epsilon,1] for a prepared value matrix and a column weight vector."""
+    w_vec = w_vec.astype(values.dtype, copy=False)
+    if offset is None and _score_kernel is not None:
+        scores = _score_kernel(values, w_vec)
+    else:
+        scores = _closeness(values, w_vec, offset)
+
+    # Rescale in float64: the min-max step magnifies rounding when scores are close
+    scores = scores.astype(np.float64)
 
     # Normalize to [epsilon,1] for visualization purposes
     epsilon = 0.01
     scores = (scores - scores.min()) / (scores.max() - scores.min())
     scores = scores * (1 - epsilon) + epsilon
 
-    return scores.reset_index(name='TOPSIS Score')
+    return scores
+
+
+def _closeness(values: np.ndarray, w_vec: np.ndarray, offset: np.ndarray = None) -> np.ndarray:
+    """TOPSIS closeness coefficient per region (plain NumPy)."""
+    weighted = values * w_vec
+    if offset is not None:
+        weighted += offset
+
+    # Compute ideal (max) and anti-ideal (min) solution per criterion
+    ideal = weighted.max(axis=0)
+    anti_ideal = weighted.min(axis=0)
+
+    # Euclidean distance to ideal and anti-ideal, reusing one difference buffer
+    diff = weighted - ideal
+    dist_to_ideal = np.einsum("ij,ij->i", diff, diff)
+    np.subtract(weighted, anti_ideal, out=diff)
+    dist_to_anti = np.einsum("ij,ij->i", diff, diff)
+    np.sqrt(dist_to_ideal, out=dist_to_ideal)
+    np.sqrt(dist_to_anti, out=dist_to_anti)
+
+    # TOPSIS closeness coefficient
+    return dist_to_anti / (dist_to_ideal + dist_to_anti)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _score_kernel(values, w_vec):
+        """Fused TOPSIS closeness coefficient: no (n_regions, n_criteria) temporaries.
+
+        No fastmath: NaN must propagate exactly as in `_closeness`.
+        """
+        n, m = values.shape
+        if n == 0:
+            return np.empty(0, dtype=values.dtype)
+
+        # Ideal (max) and anti-ideal (min) solution per criterion, NaN-propagating like ndarray.max/min
+        ideal = np.empty(m, dtype=values.dtype)
+        anti_ideal = np.empty(m, dtype=values.dtype)
+        for j in prange(m):
+            col_max = values[0, j] * w_vec[j]
+            col_min = col_max
+            for i in range(1, n):
+                x = values[i, j] * w_vec[j]
+                if x > col_max or np.isnan(x):
+                    col_max = x
+                if x < col_min or np.isnan(x):
+                    col_min = x
+            ideal[j] = col_max
+            anti_ideal[j] = col_min
+
+        # Euclidean distances and closeness coefficient per region
+        scores = np.empty(n, dtype=values.dtype)
+        for i in prange(n):
+            d_ideal = 0.0
+            d_anti = 0.0
+            for j in range(m):
+                x = values[i, j] * w_vec[j]
+                d_ideal += (x - ideal[j]) ** 2
+                d_anti += (x - anti_ideal[j]) ** 2
+            d_ideal = np.sqrt(d_ideal)
+            d_anti = np.sqrt(d_anti)
+            scores[i] = d_anti / (d_ideal + d_anti)
+        return scores
+
+    # Compile once at import so the first real call is not paying for it
+    _score_kernel(np.ones((2, 2), dtype=np.float32), np.ones(2, dtype=np.float32))
+else:
+    _score_kernel = None
@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def norm_data():
+    rows = [
+        ["B", "Infra", "Roads", 0.2, "Cost"],
+        ["B", "Infra", "Power", 0.9, "Benefit"],
+        ["B", "Labor", "Salary", 0.4, "Benefit"],
+        ["A", "Infra", "Roads", 1.0, "Cost"],
+        ["A", "Infra", "Power", 0.1, "Benefit"],
+        ["A", "Labor", "Salary", 0.7, "Benefit"],
+        ["C", "Infra", "Roads", 0.5, "Cost"],
+        ["C", "Infra", "Power", 0.6, "Benefit"],
+        ["C", "Labor", "Salary", 0.0, "Benefit"],
+        # Duplicate cell: pivot_table sums it
+        ["C", "Labor", "Salary", 0.3, "Benefit"],
+        # Criterion without weights and with a missing cell for A and B
+        ["C", "Land", "Parks", 1.0, "Benefit"],
+        ["D", "Infra", "Roads", 0.0, "Cost"],
+        ["D", "Infra", "Power", 1.0, "Benefit"],
+        ["D", "Labor", "Salary", 0.2, "Cost"],
+    ]
+    return pd.DataFrame(rows, columns=["Region", "Category", "Sub-category", "Value", "Cost/Benefit"])
+
+
+@pytest.fixture
+def weights():
+    return {
+        "General": {"Infra": 0.6, "Labor": 0.4},
+        "Infra": {"Roads": 0.3, "Power": 0.7},
+        "Labor": {"Salary": 1.0},
+    }
@@ -0,0 +1,48 @@
+"""Reference implementations and assertions shared by the TOPSIS and sensitivity tests."""
+import copy
+
+import numpy as np
+
+
+def pivot_topsis(norm_data, weights, criteria_type_col=None):
+    """Reference TOPSIS built on pivot_table (the original implementation)."""
+    df = norm_data.copy()
+    df["Weight"] = df.apply(lambda row: weights.get(row["Category"], {}).get(row["Sub-category"], 1.0), axis=1)
+    df["Weighted"] = df["Value"] * df["Weight"]
+    if criteria_type_col:
+        cost_mask = df[criteria_type_col].str.lower() == "cost"
+        df.loc[cost_mask, "Weighted"] = 1 - df.loc[cost_mask, "Weighted"]
+
+    df_pivot = df.pivot_table(index="Region", columns=["Category", "Sub-category"],
+                              values="Weighted", aggfunc="sum", fill_value=0)
+    ideal = df_pivot.max()
+    anti_ideal = df_pivot.min()
+    dist_to_ideal = np.sqrt(((df_pivot - ideal) ** 2).sum(axis=1))
+    dist_to_anti = np.sqrt(((df_pivot - anti_ideal) ** 2).sum(axis=1))
+    scores = dist_to_anti / (dist_to_ideal + dist_to_anti)
+
+    epsilon = 0.01
+    scores = (scores - scores.min()) / (scores.max() - scores.min())
+    scores = scores * (1 - epsilon) + epsilon
+    return scores.reset_index(name="TOPSIS Score")
+
+
+def pivot_sensitivity(norm_data, weights, delta):
+    """Reference sensitivity sweep with deep-copied, renormalized weights."""
+    results = {}
+    for category, sub_dict in weights.items():
+        for sub_category, orig_weight in sub_dict.items():
+            for suffix, factor in (("plus", 1 + delta), ("minus", 1 - delta)):
+                varied = copy.deepcopy(weights)
+                varied[category][sub_category] = orig_weight * factor
+                total = sum(varied[category].values())
+                for key in varied[category]:
+                    varied[category][key] /= total
+                results[f"{category}_{sub_category}_{suffix}"] = pivot_topsis(norm_data, varied)
+    return pivot_topsis(norm_data, weights), results
+
+
+def assert_scores_equal(result, expected):
+    assert list(result.columns) == ["Region", "TOPSIS Score"]
+    assert list(result["Region"]) == list(expected["Region"])
+    np.testing.assert_allclose(result["TOPSIS Score"], expected["TOPSIS Score"], rtol=1e-5, atol=1e-6)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Tests for `mcdm.ahp`."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcdm.ahp import ahp_weights
+
+
+def saaty_matrix():
+    arr = np.array([[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]])
+    return pd.DataFrame(arr, index=["a", "b", "c"], columns=["a", "b", "c"]).to_dict()
+
+
+def test_ahp_weights_geometric_mean():
+    weights = ahp_weights({"General": saaty_matrix()})["General"]
+
+    arr = np.array([[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]])
+    geom = np.prod(arr, axis=1) ** (1 / 3)
+    assert list(weights) == ["a", "b", "c"]
+    np.testing.assert_allclose(list(weights.values()), geom / geom.sum())
+
+
+def test_ahp_weights_relabels_mismatched_rows():
+    matrix = pd.DataFrame(saaty_matrix())
+    matrix.index = ["A", "b", "c"]  # row label edited in the workbook
+
+    weights = ahp_weights({"General": matrix.to_dict()})["General"]
+    expected = ahp_weights({"General": saaty_matrix()})["General"]
+    assert weights == pytest.approx(expected)
+
+
+def test_ahp_weights_rejects_non_square():
+    matrix = pd.DataFrame(np.ones((3, 2)), index=["a", "b", "c"], columns=["a", "b"]).to_dict()
+    with pytest.raises(ValueError, match="not square"):
+        ahp_weights({"General": matrix})
+
+
+def test_ahp_weights_validate_warns_on_non_reciprocal(capsys):
+    matrix = pd.DataFrame(saaty_matrix())
+    matrix.loc["b", "a"] = 2.0  # should be 1/3
+
+    weights = ahp_weights({"General": matrix.to_dict()})
+    assert "may not be fully reciprocal" in capsys.readouterr().out
+
+    unchecked = ahp_weights({"General": matrix.to_dict()}, validate=False)
+    assert capsys.readouterr().out == ""
+    assert unchecked == weights
+
+
+def test_ahp_weights_reciprocal_matrix_is_silent(capsys):
+    ahp_weights({"General": saaty_matrix()})
+    assert capsys.readouterr().out == ""
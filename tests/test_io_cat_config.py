@@ -1,6 +1,9 @@
 import os
+import numpy as np
+import pandas as pd
 import pytest
-from mcdm.mcdm_io import cat_config
+import mcdm.mcdm_io as mcdm_io
+from mcdm.mcdm_io import _category_tree, cat_config
 
 
 def test_cat_config(tmp_path):
@@ -29,3 +32,95 @@ def test_cat_config(tmp_path):
             # Hər satırın toplamı təxminən 1 olmalıdır (normalize)
             total = sum(cols.values())
             assert abs(total - 1.0) < 1e-6
+
+
+@pytest.fixture
+def documents(tmp_path, monkeypatch):
+    """Redirect "~/Documents" to a temporary directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    path = tmp_path / "Documents"
+    path.mkdir()
+    return path
+
+
+def fake_input(monkeypatch, edit_csv=None):
+    """Answer the ENTER prompts, optionally editing the CSV at the first one; return the prompts seen."""
+    prompts = []
+
+    def answer(prompt=""):
+        prompts.append(prompt)
+        if edit_csv is not None and "CSV" in prompt:
+            edit_csv()
+        return ""
+
+    monkeypatch.setattr("builtins.input", answer)
+    return prompts
+
+
+def test_cat_config_blank_subcategory(documents, monkeypatch):
+    csv_path = documents / "mcdm_config.csv"
+
+    def blank_first_subcategory():
+        df = pd.read_csv(csv_path)
+        df.loc[0, "Sub-category"] = None
+        df.to_csv(csv_path, index=False)
+
+    fake_input(monkeypatch, edit_csv=blank_first_subcategory)
+    categories, weights, data = cat_config(csv_path=str(csv_path))
+
+    assert data["Sub-category"].isna().sum() == 1
+    assert "General" in weights
+
+
+def test_cat_config_use_cache(documents, monkeypatch):
+    prompts = fake_input(monkeypatch)
+    first = cat_config(csv_path=str(documents / "mcdm_config.csv"))
+    assert sum("weights" in p for p in prompts) == 1
+    assert (documents / "mcdm_weights.meta").exists()
+
+    # Unchanged categories: no weights prompt, same result
+    second = cat_config(csv_path=str(documents / "mcdm_config.csv"))
+    assert sum("weights" in p for p in prompts) == 1
+    assert second[1] == first[1]
+    assert list(second[1]) == list(first[1])
+    if mcdm_io.pyarrow is not None:
+        assert sorted(p.stem for p in (documents / "mcdm_weights_cache").iterdir()) == sorted(first[1])
+
+
+def test_cat_config_without_cache(documents, monkeypatch):
+    prompts = fake_input(monkeypatch)
+    cat_config(csv_path=str(documents / "mcdm_config.csv"), use_cache=False)
+    cat_config(csv_path=str(documents / "mcdm_config.csv"), use_cache=False)
+
+    assert sum("weights" in p for p in prompts) == 2
+    assert not (documents / "mcdm_weights.meta").exists()
+    assert not (documents / "mcdm_weights_cache").exists()
+
+
+def test_cat_config_without_pyarrow(documents, monkeypatch):
+    monkeypatch.setattr(mcdm_io, "pyarrow", None)
+    prompts = fake_input(monkeypatch)
+    first = cat_config(csv_path=str(documents / "mcdm_config.csv"))
+    second = cat_config(csv_path=str(documents / "mcdm_config.csv"))
+
+    assert sum("weights" in p for p in prompts) == 1
+    assert second[1] == first[1]
+    assert not (documents / "mcdm_weights_cache").exists()
+
+
+def test_category_tree_keeps_blank_keys():
+    df = pd.DataFrame({
+        "Region": ["A", np.nan, "B", "A", "A"],
+        "Category": ["I", "I", "J", np.nan, "I"],
+        "Sub-category": ["R", "P", "Q", "S", "T"],
+    })
+
+    # Same structure as building the tree row by row
+    expected = {}
+    for _, row in df.iterrows():
+        expected.setdefault(row["Region"], {}).setdefault(row["Category"], []).append(row["Sub-category"])
+
+    tree = _category_tree(df)
+    assert repr(tree) == repr(expected)
+    assert tree["A"]["I"] == ["R", "T"]
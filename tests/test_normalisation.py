@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""Tests for `mcdm.normalisation`."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import mcdm.normalisation as normalisation
+from mcdm.normalisation import min_max_normalize
+from mcdm.topsis import topsis
+
+
+def sample_data():
+    return pd.DataFrame({
+        "Region": ["A", "A", "B", "B", "C", "C"],
+        "Category": ["Infra", "Labor"] * 3,
+        "Sub-category": ["Roads", "Salary"] * 3,
+        "Value": ["5", "600", "10", "450", "1", "700"],
+        "Cost/Benefit": ["Cost", "Benefit"] * 3,
+    })
+
+
+def test_normalized_frame_keeps_input_columns():
+    data = sample_data()
+    assert list(min_max_normalize(data).columns) == list(data.columns)
+
+
+def test_topsis_after_renaming_normalized_categories():
+    weights = {"Infra": {"Roads": 1.0}, "Labor": {"Salary": 1.0}}
+    renamed_weights = {cat.upper(): sub_dict for cat, sub_dict in weights.items()}
+
+    # Renaming after normalization must behave like renaming the input
+    normalized = min_max_normalize(sample_data())
+    normalized["Category"] = normalized["Category"].str.upper()
+    data = sample_data()
+    data["Category"] = data["Category"].str.upper()
+
+    pd.testing.assert_frame_equal(topsis(normalized, renamed_weights),
+                                  topsis(min_max_normalize(data), renamed_weights))
+
+
+def frame(values, types, subs=None):
+    n = len(values)
+    return pd.DataFrame({
+        "Region": [f"R{i}" for i in range(n)],
+        "Category": ["C"] * n,
+        "Sub-category": subs or ["S"] * n,
+        "Value": values,
+        "Cost/Benefit": types,
+    })
+
+
+def test_benefit_direction():
+    result = min_max_normalize(frame([10.0, 20.0, 30.0], ["Benefit"] * 3))
+    np.testing.assert_allclose(result["Value"], [0.0, 0.5, 1.0])
+
+
+def test_cost_direction():
+    result = min_max_normalize(frame([10.0, 20.0, 30.0], ["cost"] * 3))
+    np.testing.assert_allclose(result["Value"], [1.0, 0.5, 0.0])
+
+
+def test_groups_are_normalized_separately():
+    data = frame([1.0, 3.0, 100.0, 300.0], ["Benefit", "Benefit", "Cost", "Cost"], subs=["a", "a", "b", "b"])
+    np.testing.assert_allclose(min_max_normalize(data)["Value"], [0.0, 1.0, 1.0, 0.0])
+
+
+def test_constant_group_is_one():
+    for ctype in ("Benefit", "Cost"):
+        result = min_max_normalize(frame([7.0, 7.0, 7.0], [ctype] * 3))
+        np.testing.assert_array_equal(result["Value"], [1.0, 1.0, 1.0])
+
+
+def test_missing_value_stays_nan():
+    result = min_max_normalize(frame([10.0, np.nan, 30.0], ["Benefit"] * 3))
+    np.testing.assert_array_equal(np.isnan(result["Value"]), [False, True, False])
+    np.testing.assert_allclose(result["Value"].iloc[[0, 2]], [0.0, 1.0])
+
+
+def test_cost_benefit_flag_is_read_per_row():
+    # Each row uses its own flag (not the first row of its group)
+    result = min_max_normalize(frame([10.0, 20.0, 30.0], ["Benefit", "Cost", "Cost"]))
+    np.testing.assert_allclose(result["Value"], [0.0, 0.5, 0.0])
+
+
+def test_value_strings_are_cleaned():
+    # Min 0.5 / max 2000.5 so the normalized values reveal the parsed numbers
+    data = frame(["1 000,5", "2\u00a0000,5", "0,5"], ["Benefit"] * 3)
+    np.testing.assert_allclose(min_max_normalize(data)["Value"], [1000 / 2000, 1.0, 0.0])
+
+
+def test_numeric_values_skip_string_cleaning(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("numeric column went through string cleaning")
+
+    monkeypatch.setattr(normalisation.pd, "to_numeric", fail)
+    result = min_max_normalize(frame([10, 20, 30], ["Benefit"] * 3))
+    np.testing.assert_allclose(result["Value"], [0.0, 0.5, 1.0])
+
+
+def test_unparseable_value_raises():
+    with pytest.raises(ValueError):
+        min_max_normalize(frame(["10", "n/a", "30"], ["Benefit"] * 3))
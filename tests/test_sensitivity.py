@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Tests for `mcdm.sensitivity`."""
+import pandas as pd
+import pytest
+from joblib import Parallel
+
+import mcdm.sensitivity as sensitivity
+import mcdm.topsis as topsis_module
+from mcdm.sensitivity import sensitivity_analysis
+
+from .reference import assert_scores_equal, pivot_sensitivity
+
+
+def assert_same_results(left, right):
+    pd.testing.assert_frame_equal(left[0], right[0])
+    assert list(left[1]) == list(right[1])
+    for key in left[1]:
+        pd.testing.assert_frame_equal(left[1][key], right[1][key])
+
+
+def test_use_cache_reuses_results(norm_data, weights, tmp_path, monkeypatch):
+    expected = sensitivity_analysis(norm_data, weights)
+    first = sensitivity_analysis(norm_data, weights, use_cache=True, cache_dir=str(tmp_path))
+    assert_same_results(first, expected)
+    assert any(tmp_path.iterdir())
+
+    # A cache hit must not run the sweep again
+    def fail(*args, **kwargs):
+        raise AssertionError("sweep recomputed")
+
+    monkeypatch.setattr(sensitivity, "_sensitivity_sweep", fail)
+    assert_same_results(sensitivity_analysis(norm_data, weights, use_cache=True, cache_dir=str(tmp_path)), expected)
+
+    # Different data, weights or code are cache misses
+    changed = norm_data.assign(Value=norm_data["Value"][::-1].to_numpy())
+    for args, code_key in [((changed, weights), sensitivity._CODE_KEY),
+                           ((norm_data, {"Infra": {"Roads": 0.5, "Power": 0.5}}), sensitivity._CODE_KEY),
+                           ((norm_data, weights), "other code")]:
+        monkeypatch.setattr(sensitivity, "_CODE_KEY", code_key)
+        with pytest.raises(AssertionError, match="sweep recomputed"):
+            sensitivity_analysis(*args, use_cache=True, cache_dir=str(tmp_path))
+
+
+def test_cache_is_off_by_default(norm_data, weights, tmp_path, monkeypatch):
+    monkeypatch.setattr(sensitivity, "DEFAULT_CACHE_DIR", str(tmp_path / "cache"))
+    sensitivity_analysis(norm_data, weights)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_sensitivity_matches_pivot_table(norm_data, weights):
+    base_scores, results = sensitivity_analysis(norm_data, weights, delta=0.2)
+    expected_base, expected = pivot_sensitivity(norm_data, weights, delta=0.2)
+
+    assert_scores_equal(base_scores, expected_base)
+    assert list(results) == list(expected)
+    for key, scores in results.items():
+        assert_scores_equal(scores, expected[key])
+
+
+def test_threaded_sweep_matches_pivot_table(norm_data, weights, monkeypatch):
+    # Without the numba kernel the perturbations are scored on a joblib thread pool
+    monkeypatch.setattr(topsis_module, "_score_kernel", None)
+    monkeypatch.setattr(sensitivity, "_score_kernel", None)
+    pools = []
+
+    def spy_parallel(*args, **kwargs):
+        pools.append(kwargs)
+        return Parallel(*args, **kwargs)
+
+    monkeypatch.setattr(sensitivity, "Parallel", spy_parallel)
+
+    base_scores, results = sensitivity_analysis(norm_data, weights, delta=0.2, n_jobs=2)
+    expected_base, expected = pivot_sensitivity(norm_data, weights, delta=0.2)
+
+    assert_scores_equal(base_scores, expected_base)
+    assert list(results) == list(expected)
+    for key, scores in results.items():
+        assert_scores_equal(scores, expected[key])
+    assert pools == [{"n_jobs": 2, "prefer": "threads"}]
@@ -1,22 +1,58 @@
 #!/usr/bin/env python
+"""Tests for `mcdm.topsis`."""
+import numpy as np
+import pandas as pd
 import pytest
 
-"""Tests for `mcdm_tool` package."""
+from mcdm.topsis import _closeness, _score_kernel, topsis
 
-# from mcdm_tool import mcdm_tool
+from .reference import assert_scores_equal, pivot_topsis
 
 
-@pytest.fixture
-def response():
-    """Sample pytest fixture.
+def test_topsis_matches_pivot_table(norm_data, weights):
+    assert_scores_equal(topsis(norm_data, weights), pivot_topsis(norm_data, weights))
 
-    See more at: http://doc.pytest.org/en/latest/fixture.html
-    """
-    # import requests
-    # return requests.get('https://github.com/audreyfeldroy/cookiecutter-pypackage')
 
+def test_topsis_cost_column_matches_pivot_table(norm_data, weights):
+    result = topsis(norm_data, weights, criteria_type_col="Cost/Benefit")
+    assert_scores_equal(result, pivot_topsis(norm_data, weights, criteria_type_col="Cost/Benefit"))
 
-def test_content(response):
-    """Sample pytest test function with the pytest fixture as an argument."""
-    # from bs4 import BeautifulSoup
-    # assert 'GitHub' in BeautifulSoup(response.content).title.string
+
+def test_topsis_skips_missing_values(norm_data, weights):
+    norm_data.loc[1, "Value"] = np.nan
+    for criteria_type_col in (None, "Cost/Benefit"):
+        result = topsis(norm_data, weights, criteria_type_col=criteria_type_col)
+        assert result["TOPSIS Score"].notna().all()
+        assert_scores_equal(result, pivot_topsis(norm_data, weights, criteria_type_col=criteria_type_col))
+
+
+def test_topsis_skips_missing_keys(norm_data, weights):
+    norm_data = pd.concat([norm_data, pd.DataFrame([
+        [np.nan, "Infra", "Power", 1.0, "Benefit"],
+        ["A", np.nan, "Power", 1.0, "Benefit"],
+        ["B", "Infra", np.nan, 1.0, "Benefit"],
+    ], columns=norm_data.columns)], ignore_index=True)
+    for criteria_type_col in (None, "Cost/Benefit"):
+        result = topsis(norm_data, weights, criteria_type_col=criteria_type_col)
+        assert_scores_equal(result, pivot_topsis(norm_data, weights, criteria_type_col=criteria_type_col))
+
+
+@pytest.mark.skipif(_score_kernel is None, reason="numba is not installed")
+def test_score_kernel_matches_numpy():
+    rng = np.random.default_rng(0)
+    values = rng.random((6, 4), dtype=np.float32)
+    w_vec = rng.random(4, dtype=np.float32)
+    np.testing.assert_allclose(_score_kernel(values, w_vec), _closeness(values, w_vec), rtol=1e-5)
+
+    # NaN propagates the same way in both paths
+    values[2, 1] = np.nan
+    expected = _closeness(values, w_vec)
+    assert np.isnan(expected).all()
+    np.testing.assert_array_equal(np.isnan(_score_kernel(values, w_vec)), np.isnan(expected))
+
+
+def test_scores_span_epsilon_to_one(norm_data, weights):
+    scores = topsis(norm_data, weights)["TOPSIS Score"]
+    assert scores.dtype == np.float64
+    assert scores.min() == 0.01
+    assert scores.max() == 1.0